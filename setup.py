@@ -34,7 +34,7 @@ setup(
     install_requires=[
         "astor",
         "click",
-        "croniter",
+        "croniter>=1.3.4",
         "cryptography",
         "duckdb",
         "dateparser",
@@ -280,7 +280,7 @@ class StandaloneAudit(_Node, AuditMixin):
     expressions_: t.Optional[t.List[exp.Expression]] = Field(default=None, alias="expressions")
     jinja_macros: JinjaMacroRegistry = JinjaMacroRegistry()
     default_catalog: t.Optional[str] = None
-    depends_on_: t.Optional[t.Set[str]] = Field(default=None, alias="depends_on")
+    depends_on_: t.Optional[t.FrozenSet[str]] = Field(default=None, alias="depends_on")
     hash_raw_query: bool = False
     python_env_: t.Optional[t.Dict[str, Executable]] = Field(default=None, alias="python_env")
 
@@ -304,7 +304,7 @@ class StandaloneAudit(_Node, AuditMixin):
 
     @cached_property
     def depends_on(self) -> t.Set[str]:
-        depends_on = self.depends_on_ or set()
+        depends_on = set(self.depends_on_ or ())
 
         query = self.render_query(self)
         if query is not None:
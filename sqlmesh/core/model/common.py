@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import sys
 import typing as t
+from functools import lru_cache
 
 from sqlglot import exp
 
@@ -89,30 +91,44 @@ def default_catalog(cls: t.Type, v: t.Any) -> t.Optional[str]:
 
 
 @field_validator_v1_args
-def depends_on(cls: t.Type, v: t.Any, values: t.Dict[str, t.Any]) -> t.Optional[t.Set[str]]:
+def depends_on(cls: t.Type, v: t.Any, values: t.Dict[str, t.Any]) -> t.Optional[t.FrozenSet[str]]:
     dialect = values.get("dialect")
     default_catalog = values.get("default_catalog")
 
     if isinstance(v, (exp.Array, exp.Tuple)):
-        return {
-            normalize_model_name(
-                table.name if table.is_string else table,
-                default_catalog=default_catalog,
-                dialect=dialect,
+        return frozenset(
+            _normalize_dependency(
+                table.name if table.is_string else table, default_catalog, dialect
             )
             for table in v.expressions
-        }
+        )
     if isinstance(v, (exp.Table, exp.Column)):
-        return {normalize_model_name(v, default_catalog=default_catalog, dialect=dialect)}
+        return frozenset((_normalize_dependency(v, default_catalog, dialect),))
     if hasattr(v, "__iter__") and not isinstance(v, str):
-        return {
-            normalize_model_name(name, default_catalog=default_catalog, dialect=dialect)
-            for name in v
-        }
+        return frozenset(_normalize_dependency(name, default_catalog, dialect) for name in v)
 
     return v
 
 
+def _normalize_dependency(
+    table: t.Union[str, exp.Expression], default_catalog: t.Optional[str], dialect: t.Optional[str]
+) -> str:
+    if isinstance(table, str):
+        return _normalize_dependency_name(table, default_catalog, dialect)
+    # Anything other than a table or a column is rejected by normalize_model_name.
+    table = t.cast(t.Union[exp.Table, exp.Column], table)
+    return sys.intern(normalize_model_name(table, default_catalog=default_catalog, dialect=dialect))
+
+
+@lru_cache(maxsize=16384)
+def _normalize_dependency_name(
+    name: str, default_catalog: t.Optional[str], dialect: t.Optional[str]
+) -> str:
+    # The same upstream names show up across many models and every time models are loaded
+    # back from the state or the cache, so both the normalization and the strings are shared.
+    return sys.intern(normalize_model_name(name, default_catalog=default_catalog, dialect=dialect))
+
+
 expression_validator = field_validator(
     "query",
     "expressions_",
@@ -548,7 +548,7 @@ class _Model(ModelMeta, frozen=True):
         Returns:
             A list of all the upstream table names.
         """
-        return self.depends_on_ or set()
+        return set(self.depends_on_ or ())
 
     @property
     def columns_to_types(self) -> t.Optional[t.Dict[str, exp.DataType]]:
@@ -983,7 +983,7 @@ class SqlModel(_SqlBasedModel):
 
     @cached_property
     def depends_on(self) -> t.Set[str]:
-        depends_on = self.depends_on_ or set()
+        depends_on = set(self.depends_on_ or ())
 
         query = self.render_query(optimize=False)
         if query is not None:
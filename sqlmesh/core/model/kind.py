@@ -419,29 +419,27 @@ def _model_kind_validator(cls: t.Type, v: t.Any, values: t.Dict[str, t.Any]) ->
     if isinstance(v, _ModelKind):
         return t.cast(ModelKind, v)
 
-    if isinstance(v, (d.ModelKind, dict)):
-        props = (
-            {prop.name: prop.args.get("value") for prop in v.expressions}
-            if isinstance(v, d.ModelKind)
-            else v
-        )
-        time_data_type = props.pop("time_data_type", None)
-        if isinstance(time_data_type, exp.Expression) and not isinstance(
-            time_data_type, exp.DataType
-        ):
-            time_data_type = time_data_type.name
-        if time_data_type:
-            props["time_data_type"] = exp.DataType.build(time_data_type, dialect=dialect)
-        name = v.this if isinstance(v, d.ModelKind) else props.get("name")
-        # We want to ensure whatever name is provided to construct the class is the same name that will be
-        # found inside the class itself in order to avoid a change during plan/apply for legacy aliases.
-        # Ex: Pass in `SCD_TYPE_2` then we want to ensure we get `SCD_TYPE_2` as the kind name
-        # instead of `SCD_TYPE_2_BY_TIME`.
-        props["name"] = name
-        return model_kind_type_from_name(name)(**props)
-
-    name = (v.name if isinstance(v, exp.Expression) else str(v)).upper()
-    return model_kind_type_from_name(name)(name=name)  # type: ignore
+    if isinstance(v, d.ModelKind):
+        name = v.this
+        props = {prop.name: prop.args.get("value") for prop in v.expressions}
+    elif isinstance(v, dict):
+        name = v.get("name")
+        props = v
+    else:
+        name = (v.name if isinstance(v, exp.Expression) else str(v)).upper()
+        return model_kind_type_from_name(name)(name=name)  # type: ignore
+
+    time_data_type = props.pop("time_data_type", None)
+    if isinstance(time_data_type, exp.Expression) and not isinstance(time_data_type, exp.DataType):
+        time_data_type = time_data_type.name
+    if time_data_type:
+        props["time_data_type"] = exp.DataType.build(time_data_type, dialect=dialect)
+    # We want to ensure whatever name is provided to construct the class is the same name that will be
+    # found inside the class itself in order to avoid a change during plan/apply for legacy aliases.
+    # Ex: Pass in `SCD_TYPE_2` then we want to ensure we get `SCD_TYPE_2` as the kind name
+    # instead of `SCD_TYPE_2_BY_TIME`.
+    props["name"] = name
+    return model_kind_type_from_name(name)(**props)
 
 
 model_kind_validator = field_validator("kind", mode="before")(_model_kind_validator)
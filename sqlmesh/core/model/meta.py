@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 import typing as t
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from pydantic import Field
 from sqlglot import Dialect, exp
@@ -53,7 +54,7 @@ class ModelMeta(_Node):
     partitioned_by_: t.List[exp.Expression] = Field(default=[], alias="partitioned_by")
     clustered_by: t.List[str] = []
     default_catalog: t.Optional[str] = None
-    depends_on_: t.Optional[t.Set[str]] = Field(default=None, alias="depends_on")
+    depends_on_: t.Optional[t.FrozenSet[str]] = Field(default=None, alias="depends_on")
     columns_to_types_: t.Optional[t.Dict[str, exp.DataType]] = Field(default=None, alias="columns")
     column_descriptions_: t.Optional[t.Dict[str, str]] = None
     audits: t.List[AuditReference] = []
@@ -184,9 +185,13 @@ class ModelMeta(_Node):
         if isinstance(v, dict):
             udt = Dialect.get_or_raise(dialect).SUPPORTS_USER_DEFINED_TYPES
             for k, data_type in v.items():
-                expr = exp.DataType.build(data_type, dialect=dialect, udt=udt)
+                expr = (
+                    _build_data_type(data_type, dialect, udt)
+                    if isinstance(data_type, str)
+                    else exp.DataType.build(data_type, dialect=dialect, udt=udt)
+                )
                 expr.meta["dialect"] = dialect
-                columns_to_types[normalize_identifiers(k, dialect=dialect).name] = expr
+                columns_to_types[sys.intern(normalize_identifiers(k, dialect=dialect).name)] = expr
 
             return columns_to_types
 
@@ -300,10 +305,11 @@ class ModelMeta(_Node):
 
     @property
     def partitioned_by(self) -> t.List[exp.Expression]:
-        if self.time_column and self.time_column.column not in [
+        time_column = self.time_column
+        if time_column and time_column.column not in {
             col.name for col in self._partition_by_columns
-        ]:
-            return [*[exp.to_column(self.time_column.column)], *self.partitioned_by_]
+        }:
+            return [exp.to_column(time_column.column), *self.partitioned_by_]
         return self.partitioned_by_
 
     @property
@@ -395,3 +401,23 @@ class ModelMeta(_Node):
         return normalize_model_name(
             self.name, default_catalog=self.default_catalog, dialect=self.dialect
         )
+
+
+@lru_cache(maxsize=1024)
+def _parse_data_type(
+    data_type: str, dialect: t.Optional[str], udt: bool
+) -> t.Tuple[exp.DataType, bool]:
+    parsed = exp.DataType.build(data_type, dialect=dialect, udt=udt)
+    is_simple = not any(isinstance(arg, (exp.Expression, list)) for arg in parsed.args.values())
+    return parsed, is_simple
+
+
+def _build_data_type(data_type: str, dialect: t.Optional[str], udt: bool) -> exp.DataType:
+    """Builds a data type from a string, reusing the parsed result across columns and models.
+
+    A new expression is returned so that callers can't mutate the cached one. Types without
+    child expressions, like INT or TEXT, are rebuilt from their args, which is much cheaper
+    than a deep copy.
+    """
+    parsed, is_simple = _parse_data_type(data_type, dialect, udt)
+    return exp.DataType(**parsed.args) if is_simple else parsed.copy()
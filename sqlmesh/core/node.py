@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import typing as t
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
 from sqlglot import exp
 
+from sqlmesh.core import constants as c
 from sqlmesh.utils.cron import CroniterCache
 from sqlmesh.utils.date import TimeLike, to_datetime
 from sqlmesh.utils.errors import ConfigError
@@ -41,17 +43,7 @@ class IntervalUnit(str, Enum):
 
     @classmethod
     def from_cron(klass, cron: str) -> IntervalUnit:
-        croniter = CroniterCache(cron)
-        interval_seconds = croniter.interval_seconds
-
-        if not interval_seconds:
-            samples = [croniter.get_next() for _ in range(5)]
-            interval_seconds = int(min(b - a for a, b in zip(samples, samples[1:])).total_seconds())
-
-        for unit, seconds in INTERVAL_SECONDS.items():
-            if seconds <= interval_seconds:
-                return unit
-        raise ConfigError(f"Invalid cron '{cron}': must have a cadence of 5 minutes or more.")
+        return _interval_unit_from_cron(cron)
 
     @property
     def is_date_granularity(self) -> bool:
@@ -79,21 +71,7 @@ class IntervalUnit(str, Enum):
 
     @property
     def cron_expr(self) -> str:
-        if self == IntervalUnit.FIVE_MINUTE:
-            return "*/5 * * * *"
-        if self == IntervalUnit.QUARTER_HOUR:
-            return "*/15 * * * *"
-        if self == IntervalUnit.HALF_HOUR:
-            return "*/30 * * * *"
-        if self == IntervalUnit.HOUR:
-            return "0 * * * *"
-        if self == IntervalUnit.DAY:
-            return "0 0 * * *"
-        if self == IntervalUnit.MONTH:
-            return "0 0 1 * *"
-        if self == IntervalUnit.YEAR:
-            return "0 0 1 1 *"
-        return ""
+        return INTERVAL_CRON_EXPRS[self]
 
     def croniter(self, value: TimeLike) -> CroniterCache:
         return CroniterCache(self.cron_expr, value)
@@ -109,6 +87,10 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp for the next run.
         """
+        interval = FIXED_INTERVAL_TIMEDELTAS.get(self)
+        if interval is not None:
+            dt = to_datetime(value)
+            return (dt if estimate else _floor(dt, interval)) + interval
         return self.croniter(value).get_next(estimate=estimate)
 
     def cron_prev(self, value: TimeLike, estimate: bool = False) -> datetime:
@@ -122,6 +104,13 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp for the previous run.
         """
+        interval = FIXED_INTERVAL_TIMEDELTAS.get(self)
+        if interval is not None:
+            dt = to_datetime(value)
+            if estimate:
+                return dt - interval
+            floor = _floor(dt, interval)
+            return floor if floor < dt else floor - interval
         return self.croniter(value).get_prev(estimate=estimate)
 
     def cron_floor(self, value: TimeLike, estimate: bool = False) -> datetime:
@@ -135,6 +124,10 @@ class IntervalUnit(str, Enum):
         Returns:
             The timestamp floor.
         """
+        interval = FIXED_INTERVAL_TIMEDELTAS.get(self)
+        if interval is not None:
+            dt = to_datetime(value)
+            return dt if estimate else _floor(dt, interval)
         croniter = self.croniter(value)
         croniter.get_next(estimate=estimate)
         return croniter.get_prev(estimate=True)
@@ -159,6 +152,51 @@ INTERVAL_SECONDS = {
     IntervalUnit.FIVE_MINUTE: 60 * 5,
 }
 
+INTERVAL_CRON_EXPRS = {
+    IntervalUnit.YEAR: "0 0 1 1 *",
+    IntervalUnit.MONTH: "0 0 1 * *",
+    IntervalUnit.DAY: "0 0 * * *",
+    IntervalUnit.HOUR: "0 * * * *",
+    IntervalUnit.HALF_HOUR: "*/30 * * * *",
+    IntervalUnit.QUARTER_HOUR: "*/15 * * * *",
+    IntervalUnit.FIVE_MINUTE: "*/5 * * * *",
+}
+
+# Every unit below a month maps to a cron expression whose ticks are evenly spaced from the
+# epoch, so they can be computed without croniter. Looking the unit up in here also avoids
+# comparing enum members on every call.
+FIXED_INTERVAL_TIMEDELTAS = {
+    unit: timedelta(seconds=seconds)
+    for unit, seconds in INTERVAL_SECONDS.items()
+    if unit not in (IntervalUnit.YEAR, IntervalUnit.MONTH)
+}
+
+_EPOCH = to_datetime(c.EPOCH)
+
+
+def _floor(value: datetime, interval: timedelta) -> datetime:
+    return value - (value - _EPOCH) % interval
+
+
+@lru_cache(maxsize=4096)
+def _interval_unit_from_cron(cron: str) -> IntervalUnit:
+    """Infers the interval unit of a cron expression.
+
+    The result only depends on the cron string, so it's cached to avoid sampling croniter
+    every time a node with the same schedule is created.
+    """
+    croniter = CroniterCache(cron)
+    interval_seconds = croniter.interval_seconds
+
+    if not interval_seconds:
+        samples = [croniter.get_next() for _ in range(5)]
+        interval_seconds = int(min(b - a for a, b in zip(samples, samples[1:])).total_seconds())
+
+    for unit, seconds in INTERVAL_SECONDS.items():
+        if seconds <= interval_seconds:
+            return unit
+    raise ConfigError(f"Invalid cron '{cron}': must have a cadence of 5 minutes or more.")
+
 
 class _Node(PydanticModel):
     """
@@ -302,7 +340,7 @@ class _Node(PydanticModel):
     def croniter(self, value: TimeLike) -> CroniterCache:
         if self._croniter is None:
             self._croniter = CroniterCache(self.cron, value)
-        else:
+        elif value is not self._croniter.curr:
             self._croniter.curr = to_datetime(value)
         return self._croniter
 
@@ -343,7 +381,9 @@ class _Node(PydanticModel):
         Returns:
             The timestamp floor.
         """
-        return self.croniter(self.cron_next(value, estimate=estimate)).get_prev(estimate=True)
+        croniter = self.croniter(value)
+        croniter.get_next(estimate=estimate)
+        return croniter.get_prev(estimate=True)
 
     def text_diff(self, other: Node) -> str:
         """Produce a text diff against another node.
@@ -388,6 +428,8 @@ class NodeType(str, Enum):
 
 
 def str_or_exp_to_str(v: t.Any) -> t.Optional[str]:
+    if type(v) is str:
+        return v
     if isinstance(v, exp.Expression):
         return v.name
     return str(v) if v is not None else None
@@ -679,12 +679,14 @@ class Snapshot(PydanticModel, SnapshotInfoMixin):
             A [start, end) pair.
         """
         interval_unit = self.node.interval_unit
+        # Convert the inputs once up front so the cron and timestamp calls below don't each
+        # repeat the to_datetime cache lookup and conversion.
+        start = to_datetime(start)
         start_ts = to_timestamp(interval_unit.cron_floor(start))
         if start_ts < to_timestamp(start) and not self.model.allow_partials:
             start_ts = to_timestamp(interval_unit.cron_next(start_ts))
 
-        if is_date(end):
-            end = to_datetime(end) + timedelta(days=1)
+        end = to_datetime(end) + timedelta(days=1) if is_date(end) else to_datetime(end)
         end_ts = to_timestamp(interval_unit.cron_floor(end) if not allow_partial else end)
         if end_ts < start_ts and to_timestamp(end) > to_timestamp(start) and not strict:
             # This can happen when the interval unit is coarser than the size of the input interval.
@@ -38,17 +38,27 @@ class CroniterCache:
         self.cron = cron
         self.curr: datetime = to_datetime(now() if time is None else time)
         self.interval_seconds = interval_seconds(self.cron)
+        self._croniter: t.Optional[croniter] = None
 
     def get_next(self, estimate: bool = False) -> datetime:
         if estimate and self.interval_seconds:
             self.curr = self.curr + timedelta(seconds=self.interval_seconds)
         else:
-            self.curr = to_datetime(croniter(self.cron, self.curr).get_next() * 1000)
+            self.curr = to_datetime(self._croniter_at_curr().get_next() * 1000)
         return self.curr
 
     def get_prev(self, estimate: bool = False) -> datetime:
         if estimate and self.interval_seconds:
             self.curr = self.curr - timedelta(seconds=self.interval_seconds)
         else:
-            self.curr = to_datetime(croniter(self.cron, self.curr).get_prev() * 1000)
+            self.curr = to_datetime(self._croniter_at_curr().get_prev() * 1000)
         return self.curr
+
+    def _croniter_at_curr(self) -> croniter:
+        # Parsing the cron expression is the expensive part of croniter, so the instance is
+        # created once and moved to the current time before every step.
+        if self._croniter is None:
+            self._croniter = croniter(self.cron, self.curr)
+        else:
+            self._croniter.set_current(self.curr, force=True)
+        return self._croniter
@@ -31,8 +31,9 @@ from sqlmesh.core.model import (
 from sqlmesh.core.model.common import parse_expression
 from sqlmesh.core.model.kind import _model_kind_validator
 from sqlmesh.core.model.seed import CsvSettings
-from sqlmesh.core.node import IntervalUnit, _Node
+from sqlmesh.core.node import IntervalUnit, _interval_unit_from_cron, _Node
 from sqlmesh.core.snapshot import SnapshotChangeCategory
+from sqlmesh.utils.cron import CroniterCache
 from sqlmesh.utils.date import to_datetime, to_timestamp
 from sqlmesh.utils.errors import ConfigError, SQLMeshError
 from sqlmesh.utils.jinja import JinjaMacroRegistry, MacroInfo
@@ -1779,6 +1780,39 @@ def test_is_breaking_change():
     )
 
 
+def test_columns_data_types_not_shared():
+    columns = {"x": "int", "y": "int", "z": "decimal(10, 2)", "w": "decimal(10, 2)"}
+    model_a = create_external_model("a", columns=columns, dialect="duckdb")
+    model_b = create_external_model("b", columns=columns, dialect="duckdb")
+
+    columns_a = model_a.columns_to_types
+    columns_b = model_b.columns_to_types
+    assert columns_a and columns_b
+    assert columns_a["x"] == columns_b["x"] == exp.DataType.build("int")
+    assert columns_a["z"] == columns_b["z"] == exp.DataType.build("decimal(10, 2)")
+
+    # Simple types are rebuilt for every column.
+    assert columns_a["x"] is not columns_a["y"]
+    assert columns_a["x"] is not columns_b["x"]
+
+    # Parameterized types are deep copied for every column.
+    assert columns_a["z"] is not columns_a["w"]
+    assert columns_a["z"].expressions[0] is not columns_a["w"].expressions[0]
+    assert columns_a["z"].expressions[0] is not columns_b["z"].expressions[0]
+
+    # Mutating one column must not leak into other columns or later models.
+    columns_a["x"].meta["dialect"] = "postgres"
+    columns_a["z"].expressions[0].set("this", exp.Literal.number(20))
+    assert columns_b["x"].meta["dialect"] == "duckdb"
+    assert columns_a["w"].sql() == columns_b["z"].sql() == "DECIMAL(10, 2)"
+
+    model_c = create_external_model("c", columns=columns, dialect="duckdb")
+    columns_c = model_c.columns_to_types
+    assert columns_c
+    assert columns_c["x"].meta["dialect"] == "duckdb"
+    assert columns_c["z"].sql() == "DECIMAL(10, 2)"
+
+
 def test_parse_expression_list_with_jinja():
     input = [
         "JINJA_STATEMENT_BEGIN;\n{{ log('log message') }}\nJINJA_END;",
@@ -2128,6 +2162,36 @@ def test_custom_interval_unit():
         )
 
 
+def test_interval_unit_from_cron(mocker: MockerFixture):
+    _interval_unit_from_cron.cache_clear()
+    croniter_cache_mock = mocker.patch("sqlmesh.core.node.CroniterCache", wraps=CroniterCache)
+
+    assert IntervalUnit.from_cron("*/10 * * * *") == IntervalUnit.FIVE_MINUTE
+    assert IntervalUnit.from_cron("*/10 * * * *") == IntervalUnit.FIVE_MINUTE
+    assert IntervalUnit.from_cron("0 0 * * 1,3") == IntervalUnit.DAY
+    assert croniter_cache_mock.call_count == 2
+
+    with pytest.raises(ConfigError, match=r"must have a cadence of 5 minutes or more"):
+        IntervalUnit.from_cron("* * * * *")
+
+
+@pytest.mark.parametrize("unit", list(IntervalUnit))
+@pytest.mark.parametrize(
+    "value", ["2020-01-01", "2020-01-01 10:00:00", "2020-02-29 23:59:59.999", "2020-03-15 10:17:05"]
+)
+@pytest.mark.parametrize("estimate", [False, True])
+def test_interval_unit_cron(unit: IntervalUnit, value: str, estimate: bool):
+    croniter = CroniterCache(unit.cron_expr, value)
+    assert unit.cron_next(value, estimate=estimate) == croniter.get_next(estimate=estimate)
+
+    croniter = CroniterCache(unit.cron_expr, value)
+    assert unit.cron_prev(value, estimate=estimate) == croniter.get_prev(estimate=estimate)
+
+    croniter = CroniterCache(unit.cron_expr, value)
+    croniter.get_next(estimate=estimate)
+    assert unit.cron_floor(value, estimate=estimate) == croniter.get_prev(estimate=True)
+
+
 def test_model_table_properties() -> None:
     # Validate python model table properties
     @model(
@@ -3160,3 +3224,17 @@ def test_depends_on_default_catalog_python():
 
     assert m.default_catalog == "catalog"
     assert m.depends_on == {'"catalog"."other"."table"'}
+
+
+def test_explicit_depends_on_not_mutated():
+    expressions = d.parse(
+        """
+        MODEL (name db.table, depends_on [db.explicit]);
+
+        SELECT a FROM db.upstream
+        """
+    )
+    model = load_sql_based_model(expressions)
+
+    assert model.depends_on == {'"db"."explicit"', '"db"."upstream"'}
+    assert model.depends_on_ == frozenset({'"db"."explicit"'})
@@ -0,0 +1,32 @@
+from datetime import datetime
+
+import pytest
+
+from sqlmesh.utils.cron import CroniterCache, interval_seconds
+from sqlmesh.utils.date import UTC
+
+
+def test_interval_seconds() -> None:
+    assert interval_seconds("@daily") == 86400
+    assert interval_seconds("0 * * * *") == 3600
+    assert interval_seconds("*/5 * * * *") == 300
+    assert interval_seconds("0 5 * * 1,3") == 0
+
+
+@pytest.mark.parametrize("cron", ["@daily", "0 * * * *", "*/5 * * * *", "0 5 * * 1,3"])
+def test_croniter_cache(cron: str) -> None:
+    croniter = CroniterCache(cron, "2020-01-01 10:30:00")
+    start = croniter.curr
+
+    forward = [croniter.get_next() for _ in range(5)]
+    assert forward == sorted(forward)
+    assert forward[0] > start
+
+    backward = [croniter.get_prev() for _ in range(5)]
+    # The last step goes past the first forward result, so it is checked against a fresh instance.
+    assert backward == [*reversed(forward[:-1]), CroniterCache(cron, forward[0]).get_prev()]
+    assert croniter.curr <= start
+
+    # Moving the current time directly must be honored by the next step.
+    croniter.curr = datetime(2020, 1, 6, tzinfo=UTC)
+    assert croniter.get_next() == CroniterCache(cron, "2020-01-06").get_next()